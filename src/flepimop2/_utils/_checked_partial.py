@@ -16,6 +16,7 @@
 import functools
 import inspect
 from collections.abc import Callable
+from collections.abc import Set as AbstractSet
 from typing import Any, TypeVar
 
 from flepimop2.typing import IdentifierString
@@ -24,7 +25,7 @@ T = TypeVar("T")
 
 
 def _consolidate_args(
-    forbidden: set[IdentifierString] | None = None,
+    forbidden: AbstractSet[IdentifierString] | None = None,
     params: dict[IdentifierString, Any] | None = None,
     **kwargs: Any,
 ) -> dict[IdentifierString, Any]:
@@ -32,7 +33,8 @@ def _consolidate_args(
     Bind static parameters to a callable, checking their validity.
 
     Args:
-        forbidden: A set of parameter names that are not allowed to be bound.
+        forbidden: A set of parameter names that are not allowed to be bound,
+            typically a module-level `frozenset` shared across calls.
         params: A dictionary of parameters to statically define for the System.
         **kwargs: Additional parameters to statically define for the System.
 
@@ -64,21 +66,20 @@ def _consolidate_args(
 
     params = params or {}
     # confirm that kwargs and params do not have overlapping keys
-    if overlapping_keys := set(params.keys()).intersection(kwargs.keys()):
+    if overlapping_keys := params.keys() & kwargs.keys():
         msg = f"Cannot offer overlapping keys in params and kwargs: {overlapping_keys}."
         validation_errors.append(msg)
 
     combined_params = {**params, **kwargs}
-
-    offered_keys = set(combined_params.keys())
-    if not offered_keys:
+    if not combined_params:
         return {}
 
-    forbidden = forbidden or set()
-
     # Validate that forbidden keys are not offered
-    if forbidden.intersection(offered_keys):
-        msg = f"Cannot bind forbidden keys: {forbidden}; offered keys: {offered_keys}."
+    if forbidden and not forbidden.isdisjoint(combined_params):
+        msg = (
+            f"Cannot bind forbidden keys: {set(forbidden)}; "
+            f"offered keys: {set(combined_params)}."
+        )
         validation_errors.append(msg)
 
     if validation_errors:
@@ -116,29 +117,24 @@ def _checked_partial(
         >>> new_func(a=1.0, b=[1.0, 2.0, 3.0])
         12.0
     """
-    if params is None:
-        return func
-
-    offered_keys = set(params.keys())
-    if not offered_keys:
+    if not params:
         return func
 
     validation_errors: list[str] = []
 
     # Validate that offered keys are in the func signature
     signature = inspect.signature(func)
-    signature_keys = set(signature.parameters.keys())
-    if invalid_keys := offered_keys - signature_keys:
+    if invalid_keys := params.keys() - signature.parameters.keys():
         msg = (
             "Offered keys are not in func signature: "
             f"{invalid_keys}. Signature parameters are: "
-            f"{signature_keys}."
+            f"{set(signature.parameters)}."
         )
         validation_errors.append(msg)
 
     # Validate parameter value types against signature annotations
     for key, value in signature.parameters.items():
-        if key not in offered_keys:
+        if key not in params:
             continue
         expected_type = value.annotation
         if expected_type is inspect.Parameter.empty or expected_type is Any:
@@ -66,9 +66,11 @@ def _resolve_config_target(
     if not group:
         msg = f"No targets available in the group for '{group_name}'."
         raise UsageError(msg)
+    res: T | None
     if name is None:
-        name = next(iter(group.keys()))
-    res = group.get(name)
+        name, res = next(iter(group.items()))
+    else:
+        res = group.get(name)
     if res is None:
         msg = f"Target '{name}' not available from {group.keys()} for '{group_name}'."
         raise BadOptionUsage(option_name="target", message=msg)
@@ -15,8 +15,9 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """Private utilities for dynamic module loading and validation."""
 
-import inspect
 import re
+import sys
+from functools import lru_cache
 from importlib import import_module
 from importlib.util import module_from_spec, spec_from_file_location
 from os import PathLike
@@ -29,6 +30,7 @@ from typing import (
     Self,
     TypeVar,
 )
+from weakref import WeakKeyDictionary
 
 from pydantic import TypeAdapter, ValidationError
 
@@ -45,6 +47,10 @@ SHORTHAND_PATTERN = re.compile(
     re.DOTALL,
 )
 IDENTIFIER_STRING_ADAPTER = TypeAdapter(IdentifierString)
+_LOADED_MODULES: dict[tuple[str, str], tuple[bytes, ModuleType]] = {}
+_MODULE_CLASS_CACHE: WeakKeyDictionary[
+    ModuleType, dict[tuple[str, type[ModuleBase]], type[ModuleBase]]
+] = WeakKeyDictionary()
 
 
 class ParsedShorthand(NamedTuple):
@@ -152,6 +158,12 @@ def _load_module(path: PathLike[str], mod_name: str) -> ModuleType:
     """
     Load a Python module from a given file path as a given name.
 
+    Loaded modules are cached by path and module name, so loading a file whose
+    contents are unchanged returns the already executed module. Every caller
+    loading the same script therefore shares one module object, including any
+    module-level state such as random number generators or counters. The file
+    is re-executed whenever its contents change.
+
     Args:
         path: The path to the Python file.
         mod_name: The name of the module to load.
@@ -165,22 +177,48 @@ def _load_module(path: PathLike[str], mod_name: str) -> ModuleType:
         ImportError: If the module could not be loaded.
 
     """
-    resolved = Path(path).expanduser().resolve()
-    if not resolved.exists():
+    resolved = Path(path).expanduser().absolute()
+    try:
+        source = resolved.read_bytes()
+    except OSError:
         msg = f"No file found at: {resolved}"
-        raise FileNotFoundError(msg)
+        raise FileNotFoundError(msg) from None
     if resolved.suffix != ".py":
         msg = f"No valid Python file found at: {resolved}"
         raise FileNotFoundError(msg)
+    key = (str(resolved), mod_name)
+    cached = _LOADED_MODULES.get(key)
+    if cached is not None and cached[0] == source:
+        return cached[1]
     spec = spec_from_file_location(mod_name, str(resolved))
     if not (spec and spec.loader):
         msg = f"Could not load module from spec at: {resolved}"
         raise ImportError(msg)
     module = module_from_spec(spec)
     spec.loader.exec_module(module)
+    _LOADED_MODULES[key] = (source, module)
     return module
 
 
+def _import_module(name: str) -> ModuleType:
+    """
+    Import a module by name, returning the `sys.modules` entry when present.
+
+    Args:
+        name: The fully qualified module name.
+
+    Returns:
+        The imported module.
+
+    Examples:
+        >>> import flepimop2.yaml
+        >>> from flepimop2._utils._module import _import_module
+        >>> _import_module("flepimop2.yaml") is flepimop2.yaml
+        True
+    """
+    return sys.modules.get(name) or import_module(name)
+
+
 def _validate_function(module: ModuleType, func_name: str) -> bool:
     """
     Check if a module has a callable function with the given name.
@@ -193,7 +231,7 @@ def _validate_function(module: ModuleType, func_name: str) -> bool:
         `True` if the module has a callable function with the given name,
         `False` otherwise.
     """
-    return hasattr(module, func_name) and callable(getattr(module, func_name))
+    return callable(getattr(module, func_name, None))
 
 
 def _find_module_class(
@@ -204,6 +242,11 @@ def _find_module_class(
     """
     Find a `ModuleBase` subclass defined directly in a module.
 
+    Results are cached per module object, so repeated builds from the same
+    imported module skip the class scan. Modules that are re-loaded produce a
+    new module object and are therefore scanned again. When several classes
+    qualify, the one bound to the alphabetically first attribute name wins.
+
     Args:
         mod: The module to search.
         mod_name: The fully qualified module name (used to filter classes to
@@ -217,14 +260,22 @@ def _find_module_class(
         AttributeError: If no valid class is found.
 
     """
-    for _, obj in inspect.getmembers(mod, inspect.isclass):
-        if obj.__module__ != mod_name:
-            continue
-        try:
-            if issubclass(obj, enforced_type) and issubclass(obj, ModuleBase):
-                return obj
-        except TypeError:
+    module_cache = _MODULE_CLASS_CACHE.setdefault(mod, {})
+    if (cached := module_cache.get((mod_name, enforced_type))) is not None:
+        return cached  # type: ignore[return-value]
+    match: tuple[str, type[T]] | None = None
+    for name, obj in vars(mod).items():
+        if not isinstance(obj, type) or obj.__module__ != mod_name:
             continue
+        if (
+            issubclass(obj, enforced_type)
+            and issubclass(obj, ModuleBase)
+            and (match is None or name < match[0])
+        ):
+            match = (name, obj)
+    if match is not None:
+        module_cache[mod_name, enforced_type] = match[1]
+        return match[1]
     msg = (
         f"Module '{mod_name}' does not define a {enforced_type.__name__} subclass "
         "that inherits from ModuleBase."
@@ -232,6 +283,7 @@ def _find_module_class(
     raise AttributeError(msg)
 
 
+@lru_cache(maxsize=256)
 def _resolve_module_name(module: str, namespace: Namespace) -> str:
     """
     Resolve a module name, optionally prefixing it with a namespace.
@@ -286,7 +338,7 @@ def _build(
     if isinstance(config, str):
         parsed = ParsedShorthand.from_string(config)
         module_path = _resolve_module_name(parsed.module, namespace)
-        mod = import_module(module_path)
+        mod = _import_module(module_path)
         target_class = _find_module_class(mod, module_path, enforced_type)
         try:
             instance = target_class.from_shorthand(parsed.args)
@@ -305,11 +357,14 @@ def _build(
         module_path = _resolve_module_name(configured_module, namespace)
         config_dict["module"] = module_path
 
-        mod = import_module(module_path)
+        mod = _import_module(module_path)
         target_class = _find_module_class(mod, module_path, enforced_type)
         instance = target_class.model_validate(config_dict)
 
-    if not isinstance(instance, enforced_type):
+    # `_find_module_class` already guarantees `target_class` is a subclass of
+    # `enforced_type`, so the ABC instance check is only needed for the rare
+    # builder that returns something other than the class it was called on.
+    if type(instance) is not target_class and not isinstance(instance, enforced_type):
         msg = f"Built {type(instance)}, expected {enforced_type}"
         raise TypeError(msg)
 
@@ -23,7 +23,7 @@ models.
 __all__ = ()
 
 
-from typing import Annotated, TypeVar
+from typing import Annotated, Final, TypeVar
 
 import numpy as np
 from pydantic import Field, StringConstraints
@@ -32,13 +32,13 @@ from flepimop2.typing import Float64NDArray
 
 T = TypeVar("T")
 
+_RANGE_SPEC_PATTERN: Final = r"^[+-]?\d+(\.\d+)?(:[+-]?\d+(\.\d+)?){1,2}$"
+
 """A string specifying a range in the format 'start:end' or 'start:step:end'."""
 RangeSpec = (
     Annotated[
         str,
-        StringConstraints(
-            pattern=r"^[+-]?\d+(\.\d+)?(:[+-]?\d+(\.\d+)?){1,2}$", strip_whitespace=True
-        ),
+        StringConstraints(pattern=_RANGE_SPEC_PATTERN, strip_whitespace=True),
     ]
     | Annotated[list[float], Field(min_length=2)]
 )
@@ -94,7 +94,7 @@ def _to_np_array(value: RangeSpec) -> Float64NDArray:
         A NumPy array of floats.
     """
     if isinstance(value, str):
-        parts = [np.float64(part.strip()) for part in value.split(":")]
+        parts = [float(part) for part in value.split(":")]
         start, end = parts[0], parts[-1]
         step = parts[1] if len(parts) == 3 else 1.0
         return np.arange(start, end + step / 2.0, step, dtype=np.float64)
@@ -18,7 +18,8 @@ Abstract base classes for flepimop2 modules.
 
 This module provides abstract base classes (ABCs) for key modules of the flepimop2
 pipeline. The ABCs defined here can also be found in their respective submodules, but
-are re-exported here for developer convenience.
+are re-exported here for developer convenience and are imported lazily on first
+access.
 
 """
 
@@ -32,9 +33,62 @@ __all__ = [
     "SystemProtocol",
 ]
 
-from flepimop2.backend.abc import BackendABC
-from flepimop2.engine.abc import EngineABC, EngineProtocol
-from flepimop2.parameter.abc import ParameterABC
-from flepimop2.process.abc import ProcessABC
-from flepimop2.system.abc import SystemABC
-from flepimop2.typing import SystemProtocol
+from importlib import import_module
+from typing import TYPE_CHECKING, Final
+
+if TYPE_CHECKING:
+    from flepimop2.backend.abc import BackendABC
+    from flepimop2.engine.abc import EngineABC, EngineProtocol
+    from flepimop2.parameter.abc import ParameterABC
+    from flepimop2.process.abc import ProcessABC
+    from flepimop2.system.abc import SystemABC
+    from flepimop2.typing import SystemProtocol
+
+_LAZY_IMPORTS: Final = {
+    "BackendABC": "flepimop2.backend.abc",
+    "EngineABC": "flepimop2.engine.abc",
+    "EngineProtocol": "flepimop2.engine.abc",
+    "ParameterABC": "flepimop2.parameter.abc",
+    "ProcessABC": "flepimop2.process.abc",
+    "SystemABC": "flepimop2.system.abc",
+    "SystemProtocol": "flepimop2.typing",
+}
+
+
+def __getattr__(name: str) -> object:
+    """
+    Import the re-exported ABCs on first access.
+
+    Args:
+        name: The attribute being looked up.
+
+    Returns:
+        The re-exported object, which is also cached in the module namespace.
+
+    Raises:
+        AttributeError: If `name` is not one of the re-exported ABCs.
+
+    Examples:
+        >>> from flepimop2.abcs import SystemABC
+        >>> from flepimop2.system.abc import SystemABC as Original
+        >>> SystemABC is Original
+        True
+    """
+    try:
+        module = _LAZY_IMPORTS[name]
+    except KeyError:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg) from None
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """
+    List the module attributes, including ABCs that are not yet imported.
+
+    Returns:
+        The sorted attribute names.
+    """
+    return sorted({*globals(), *__all__})
@@ -17,8 +17,10 @@
 
 __all__ = ["Axis", "AxisCollection", "ResolvedAxisConfig", "ResolvedShape"]
 
+import sys
 from collections.abc import Iterator, Mapping, Sequence
 from dataclasses import dataclass
+from functools import lru_cache
 from itertools import pairwise
 from typing import Literal, TypeVar, overload
 
@@ -36,6 +38,40 @@ ResolvedAxisConfig = (
     AxesGroupModel | Mapping[IdentifierString, object] | dict[IdentifierString, object]
 )
 T = TypeVar("T")
+AXES_GROUP_ADAPTER = TypeAdapter(AxesGroupModel)
+
+
+@lru_cache(maxsize=256)
+def _continuous_edges(
+    lo: float, hi: float, num: int, spacing: Literal["linear", "log"]
+) -> tuple[float, ...]:
+    """
+    Compute evenly spaced edges over a continuous domain.
+
+    Results are cached, so axes sharing a domain, size, and spacing (or one axis
+    queried repeatedly) only compute their edges once.
+
+    Args:
+        lo: The lower bound of the domain.
+        hi: The upper bound of the domain.
+        num: The number of edges.
+        spacing: Whether edges are spaced `"linear"` or `"log"`-uniformly.
+
+    Returns:
+        The edge coordinates.
+
+    Examples:
+        >>> from flepimop2.axis import _continuous_edges
+        >>> _continuous_edges(0.0, 8.0, 5, "linear")
+        (0.0, 2.0, 4.0, 6.0, 8.0)
+        >>> _continuous_edges(1.0, 100.0, 3, "log")
+        (1.0, 10.0, 100.0)
+    """
+    if spacing == "linear":
+        edges = np.linspace(lo, hi, num, dtype=np.float64)
+    else:
+        edges = np.geomspace(lo, hi, num, dtype=np.float64)
+    return tuple(edges.tolist())
 
 
 @dataclass(frozen=True, slots=True)
@@ -180,11 +216,7 @@ class Axis:
             (0.0, 2.0, 4.0, 6.0, 8.0)
         """
         lo, hi = self._continuous_domain()
-        if self.spacing == "linear":
-            edges = np.linspace(lo, hi, self.size + 1, dtype=np.float64)
-        else:
-            edges = np.geomspace(lo, hi, self.size + 1, dtype=np.float64)
-        return tuple(edges.tolist())
+        return _continuous_edges(lo, hi, self.size + 1, self.spacing)
 
     def bins(self) -> tuple[tuple[float, float], ...]:
         """
@@ -207,9 +239,7 @@ class Axis:
             >>> axis.bins()
             ((0.0, 2.0), (2.0, 4.0))
         """
-        self._continuous_domain()
-        edges = self.bin_edges()
-        return tuple(pairwise(edges))
+        return tuple(pairwise(self.bin_edges()))
 
     def points(self) -> tuple[float, ...]:
         """
@@ -250,12 +280,10 @@ class Axis:
              5.623413251903491e-06,
              0.0001778279410038923)
         """
-        lo, hi = self._continuous_domain()
+        edges = np.asarray(self.bin_edges(), dtype=np.float64)
         if self.spacing == "linear":
-            edges = np.linspace(lo, hi, self.size + 1, dtype=np.float64)
             points = 0.5 * (edges[:-1] + edges[1:])
         else:
-            edges = np.geomspace(lo, hi, self.size + 1, dtype=np.float64)
             points = np.sqrt(edges[:-1] * edges[1:])
         return tuple(points.tolist())
 
@@ -268,6 +296,9 @@ class Axis:
         """
         Build an `Axis` from a configuration model.
 
+        Categorical labels are interned, so labels repeated across axes share a
+        single string object and hash/compare cheaply when used as keys.
+
         Returns:
             The resolved runtime axis.
         """
@@ -283,7 +314,7 @@ class Axis:
             name=name,
             kind=model.kind,
             size=len(model.labels),
-            labels=model.labels,
+            labels=tuple(map(sys.intern, model.labels)),
             values=model.values,
         )
 
@@ -340,7 +371,7 @@ class AxisCollection(Mapping[IdentifierString, Axis]):
         Returns:
             The resolved runtime axis collection.
         """
-        validated = TypeAdapter(AxesGroupModel).validate_python(config)
+        validated = AXES_GROUP_ADAPTER.validate_python(config)
         return cls({
             name: Axis.from_model(name, axis) for name, axis in validated.items()
         })
@@ -17,8 +17,14 @@
 
 __all__ = ["BackendABC", "build"]
 
+import os
 from abc import abstractmethod
-from typing import Any
+from functools import lru_cache
+from pathlib import Path
+from stat import S_ISDIR
+from typing import Any, ClassVar
+
+from pydantic import Field, PrivateAttr, field_validator
 
 from flepimop2._utils._module import _build
 from flepimop2.meta import RunMeta
@@ -62,6 +68,117 @@ class BackendABC(ModuleBase, module_namespace="backend"):
         ...
 
 
+def _writable_directory(root: Path) -> Path:
+    """
+    Validate that a path is a writable directory.
+
+    Args:
+        root: The path to validate.
+
+    Returns:
+        The validated path.
+
+    Raises:
+        TypeError: If the path is not a directory or is not writable.
+    """
+    msg = f"The specified 'root' is not a directory or is not writable: {root}"
+    try:
+        mode = root.stat().st_mode
+    except OSError:
+        raise TypeError(msg) from None
+    if not (S_ISDIR(mode) and os.access(root, os.W_OK)):
+        raise TypeError(msg)
+    return root
+
+
+@lru_cache(maxsize=128)
+def _run_file_name(run_meta: RunMeta, suffix: str) -> str:
+    """
+    Format the output file name for a run.
+
+    `RunMeta` is an immutable named tuple, so the formatted name is cached per run
+    and repeated saves and reads skip re-formatting the timestamp.
+
+    Args:
+        run_meta: Metadata about the run.
+        suffix: The file suffix, including the leading dot.
+
+    Returns:
+        The file name, of the form `[name_]action_YYYYmmdd_HHMMSS<suffix>`.
+
+    Examples:
+        >>> from datetime import UTC, datetime
+        >>> from flepimop2.backend.abc import _run_file_name
+        >>> from flepimop2.meta import RunMeta
+        >>> timestamp = datetime(2024, 6, 15, 8, 45, 0, tzinfo=UTC)
+        >>> _run_file_name(RunMeta(timestamp=timestamp, name="demo"), ".csv")
+        'demo_simulate_20240615_084500.csv'
+        >>> _run_file_name(RunMeta(timestamp=timestamp), ".npy")
+        'simulate_20240615_084500.npy'
+    """
+    timestamp_str = run_meta.timestamp.strftime("%Y%m%d_%H%M%S")
+    name_part = f"{run_meta.name}_" if run_meta.name else ""
+    return f"{name_part}{run_meta.action}_{timestamp_str}{suffix}"
+
+
+class _FileBackendABC(BackendABC):
+    """
+    Shared base for backends that store one file per run under a root directory.
+
+    Subclasses set `_file_suffix` and implement `_save`/`_read` in terms of
+    `_get_file_path` and `_prepare_file_path`.
+    """
+
+    root: Path = Field(default_factory=lambda: Path.cwd() / "model_output")
+    _file_suffix: ClassVar[str]
+    _known_dirs: set[Path] = PrivateAttr(default_factory=set)
+
+    @field_validator("root", mode="after")
+    @classmethod
+    def _validate_root(cls, root: Path) -> Path:
+        """
+        Validate that the root path is a writable directory.
+
+        Args:
+            root: The root path to validate.
+
+        Returns:
+            The validated root path.
+
+        Raises:
+            TypeError: If the root path is not a directory or is not writable.
+        """  # noqa: DOC502
+        return _writable_directory(root)
+
+    def _get_file_path(self, run_meta: RunMeta) -> Path:
+        """
+        Generate a dynamic file path based on run metadata.
+
+        Args:
+            run_meta: Metadata about the current run.
+
+        Returns:
+            The dynamically generated file path.
+        """
+        return self.root / _run_file_name(run_meta, self._file_suffix)
+
+    def _prepare_file_path(self, run_meta: RunMeta) -> Path:
+        """
+        Generate the file path for a run, creating its parent directory if needed.
+
+        Args:
+            run_meta: Metadata about the current run.
+
+        Returns:
+            The dynamically generated file path.
+        """
+        file_path = self._get_file_path(run_meta)
+        if (parent := file_path.parent) not in self._known_dirs:
+            parent.mkdir(parents=True, exist_ok=True)
+            self._known_dirs.add(parent)
+        return file_path
+
+
 def build(config: dict[str, Any] | ModuleBase | str) -> BackendABC:
     """Build a `BackendABC` from a configuration dictionary.
 
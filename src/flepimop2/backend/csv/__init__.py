@@ -17,56 +17,18 @@
 
 __all__ = ["CsvBackend"]
 
-import os
-from pathlib import Path
 
 import numpy as np
-from pydantic import Field, field_validator
 
-from flepimop2.backend.abc import BackendABC
+from flepimop2.backend.abc import _FileBackendABC
 from flepimop2.meta import RunMeta
 from flepimop2.typing import Float64NDArray
 
 
-class CsvBackend(BackendABC, module="csv"):
+class CsvBackend(_FileBackendABC, module="csv"):
     """CSV backend for saving numpy arrays to CSV files."""
 
-    root: Path = Field(default_factory=lambda: Path.cwd() / "model_output")
-
-    @field_validator("root", mode="after")
-    @classmethod
-    def _validate_root(cls, root: Path) -> Path:
-        """
-        Validate that the root path is a writable directory.
-
-        Args:
-            root: The root path to validate.
-
-        Returns:
-            The validated root path.
-
-        Raises:
-            TypeError: If the root path is not a directory or is not writable.
-        """
-        if not (root.is_dir() and os.access(root, os.W_OK)):
-            msg = f"The specified 'root' is not a directory or is not writable: {root}"
-            raise TypeError(msg)
-        return root
-
-    def _get_file_path(self, run_meta: RunMeta) -> Path:
-        """
-        Generate a dynamic file path based on run metadata.
-
-        Args:
-            run_meta: Metadata about the current run.
-
-        Returns:
-            The dynamically generated file path.
-        """
-        timestamp_str = run_meta.timestamp.strftime("%Y%m%d_%H%M%S")
-        name_part = f"{run_meta.name}_" if run_meta.name else ""
-        filename = f"{name_part}{run_meta.action}_{timestamp_str}.csv"
-        return self.root / filename
+    _file_suffix = ".csv"
 
     def _save(self, data: Float64NDArray, run_meta: RunMeta) -> None:
         """
@@ -76,8 +38,7 @@ class CsvBackend(BackendABC, module="csv"):
             data: The numpy array to save.
             run_meta: Metadata about the current run.
         """
-        file_path = self._get_file_path(run_meta)
-        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path = self._prepare_file_path(run_meta)
         np.savetxt(file_path, data, delimiter=",")
 
     def _read(self, run_meta: RunMeta) -> Float64NDArray:
@@ -0,0 +1,64 @@
+# flepimop2: The FLExible Pipeline for Interchangeable MOdel Processing
+# Copyright (C) 2026  Carl Pearson, Joshua Macdonald, Timothy Willard
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""NumPy binary backend for flepimop2."""
+
+__all__ = ["NpyBackend"]
+
+from typing import cast
+
+import numpy as np
+
+from flepimop2.backend.abc import _FileBackendABC
+from flepimop2.meta import RunMeta
+from flepimop2.typing import Float64NDArray
+
+
+class NpyBackend(_FileBackendABC, module="npy"):
+    """
+    NumPy `.npy` backend for saving numpy arrays as binary files.
+
+    Arrays are stored in NumPy's native binary format, so saving and reading skip
+    text formatting and parsing entirely. Reads are memory-mapped and return
+    read-only arrays backed by the file on disk.
+    """
+
+    _file_suffix = ".npy"
+
+    def _save(self, data: Float64NDArray, run_meta: RunMeta) -> None:
+        """
+        Save a numpy array to a `.npy` file.
+
+        Args:
+            data: The numpy array to save.
+            run_meta: Metadata about the current run.
+        """
+        file_path = self._prepare_file_path(run_meta)
+        np.save(file_path, data, allow_pickle=False)
+
+    def _read(self, run_meta: RunMeta) -> Float64NDArray:
+        """
+        Read a numpy array from a `.npy` file.
+
+        Args:
+            run_meta: Metadata about the current run.
+
+        Returns:
+            A read-only, memory-mapped view of the numpy array stored on disk.
+        """
+        file_path = self._get_file_path(run_meta)
+        return cast(
+            "Float64NDArray", np.load(file_path, mmap_mode="r", allow_pickle=False)
+        )
@@ -22,10 +22,15 @@ import logging
 import re
 import sys
 from abc import ABC, abstractmethod
+from importlib import import_module
 from pathlib import Path
 from typing import Any
 
-from flepimop2._utils._click import _click_param_for_option, _render_param
+from flepimop2._utils._click import (
+    _click_param_for_option,
+    _render_param,
+    _resolve_config_target,
+)
 from flepimop2.cli._logging import get_script_logger
 from flepimop2.cli._options import COMMON_OPTIONS
 from flepimop2.typing import ExitCode
@@ -43,6 +48,7 @@ class CliCommand(ABC):
     """
 
     auto_append_verbosity: bool = True
+    target_section: str | None = None
     logger: logging.Logger | None = None
     bound_kwargs: dict[str, Any]
 
@@ -91,11 +97,24 @@ class CliCommand(ABC):
         """
         Get the resolved logical target for this command, if any.
 
-        Commands that do not operate on a named configuration target should use
-        this default implementation. Target-aware commands should override this
-        property and return the resolved configuration entry name.
+        Commands that set `target_section` resolve their `target` kwarg against
+        that section of the bound configuration file, falling back to the
+        section's first entry when no target was given. Commands without a
+        `target_section` return `None`. Commands with more complex targeting can
+        override this property and return the resolved configuration entry name.
         """
-        return None
+        if self.target_section is None:
+            return None
+        configuration = import_module("flepimop2.configuration")
+        config_model = configuration.ConfigurationModel.from_yaml(
+            self.bound_kwargs["config"]
+        )
+        target, _ = _resolve_config_target(
+            getattr(config_model, self.target_section),
+            self.bound_kwargs.get("target"),
+            self.target_section,
+        )
+        return target
 
     @property
     def config(self) -> Path | None:
@@ -238,6 +257,21 @@ class CliCommand(ABC):
         """
         return inspect.cleandoc(cls.__doc__ or "No description available.")
 
+    def is_enabled_for(self, level: int) -> bool:
+        """
+        Check whether a message at `level` would be emitted.
+
+        Log calls already defer %-style formatting until a record is emitted,
+        so this is only needed to skip building expensive arguments.
+
+        Args:
+            level: The logging level to check, e.g. `logging.INFO`.
+
+        Returns:
+            Whether the command has a logger enabled for `level`.
+        """
+        return self.logger is not None and self.logger.isEnabledFor(level)
+
     def log(self, level: int, *args: Any, **kwargs: Any) -> None:
         """Log a message at the specified level."""
         if self.logger is None:
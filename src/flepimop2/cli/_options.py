@@ -19,6 +19,7 @@ __all__ = []
 
 from collections.abc import Callable
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any, Final, TypeVar, cast
 
 import click
@@ -135,9 +136,9 @@ def _argument_help_records(
     ]
 
 
-# Dictionary of common Click options and arguments
+# Read-only mapping of common Click options and arguments
 # These can be requested by command classes to maintain consistency
-COMMON_OPTIONS: Final[dict[str, CommonOptionEntry]] = {
+COMMON_OPTIONS: Final[MappingProxyType[str, CommonOptionEntry]] = MappingProxyType({
     "check": (
         click.option(
             "--check",
@@ -275,7 +276,7 @@ COMMON_OPTIONS: Final[dict[str, CommonOptionEntry]] = {
         ),
         None,
     ),
-}
+})
 
 
 def get_option(name: str) -> Callable[[FC], FC]:
@@ -291,10 +292,12 @@ def get_option(name: str) -> Callable[[FC], FC]:
     Raises:
         KeyError: If the option name is not found.
     """
-    if (entry := COMMON_OPTIONS.get(name)) is None:
+    try:
+        decorator = COMMON_OPTIONS[name][0]
+    except KeyError:
         msg = (
             f"Unknown option '{name}'. "
             f"Available options: {', '.join(COMMON_OPTIONS.keys())}"
         )
-        raise KeyError(msg)
-    return cast("Callable[[FC], FC]", entry[0])
+        raise KeyError(msg) from None
+    return cast("Callable[[FC], FC]", decorator)
@@ -13,16 +13,16 @@
 #
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
-"""Simulate command implementation."""
+"""Process command implementation."""
 
 __all__ = []
 
+from importlib import import_module
 from pathlib import Path
 
 from flepimop2._utils._click import _resolve_config_target
 from flepimop2.cli._cli_command import CliCommand
 from flepimop2.configuration import ConfigurationModel
-from flepimop2.process.abc import build as build_process
 from flepimop2.typing import ExitCode
 
 
@@ -33,21 +33,7 @@ class ProcessCommand(CliCommand):
     The `CONFIG` argument should point to a valid configuration file.
     """
 
-    @property
-    def target(self) -> str | None:
-        """
-        Get the resolved process target name.
-
-        The returned value accounts for the implicit default target used when
-        no `--target` option was provided.
-        """
-        configmodel = ConfigurationModel.from_yaml(self.bound_kwargs["config"])
-        target, _ = _resolve_config_target(
-            configmodel.process,
-            self.bound_kwargs.get("target"),
-            "process",
-        )
-        return target
+    target_section = "process"
 
     def run(  # type: ignore[override]
         self,
@@ -67,6 +53,8 @@ class ProcessCommand(CliCommand):
         Returns:
             An exit code indicating success or failure.
         """
+        build_process = import_module("flepimop2.process.abc").build
+
         configmodel = ConfigurationModel.from_yaml(config)
         processconfig = configmodel.process
         processtargetname, processtarget = _resolve_config_target(
@@ -75,9 +63,9 @@ class ProcessCommand(CliCommand):
             "process",
         )
 
-        self.info(f"Processing configuration file: {config}")
-        self.info(f"Process section: {processconfig}")
-        self.info(f"Process target: {processtargetname} => {processtarget}")
+        self.info("Processing configuration file: %s", config)
+        self.info("Process section: %s", processconfig)
+        self.info("Process target: %s => %s", processtargetname, processtarget)
 
         process_instance = build_process(processtarget)
         process_instance.execute(dry_run=dry_run)
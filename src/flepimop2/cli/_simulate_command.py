@@ -17,27 +17,43 @@
 
 __all__ = []
 
+from functools import cache
+from importlib import import_module
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import numpy as np
 
-from flepimop2._utils._click import _resolve_config_target
-from flepimop2.axis import ResolvedShape
 from flepimop2.cli._cli_command import CliCommand
 from flepimop2.configuration import ConfigurationModel
-from flepimop2.meta import RunMeta
-from flepimop2.parameter.abc import ParameterValue
-from flepimop2.scenario.abc import build as build_scenario
-from flepimop2.simulator import Simulator
 from flepimop2.typing import ExitCode
 
+if TYPE_CHECKING:
+    from flepimop2.axis import ResolvedShape
+    from flepimop2.parameter.abc import ParameterValue
+
+
+@cache
+def _parameter_value_types() -> "tuple[type[ParameterValue], type[ResolvedShape]]":
+    """
+    Import the types used to build scenario values on first use.
+
+    Returns:
+        The `ParameterValue` and `ResolvedShape` classes.
+    """
+    return (
+        import_module("flepimop2.parameter.abc").ParameterValue,
+        import_module("flepimop2.axis").ResolvedShape,
+    )
+
 
 def _scenario_value(
     value: object,
-    template: ParameterValue | None = None,
-) -> ParameterValue:
-    shape = template.shape if template is not None else ResolvedShape()
-    return ParameterValue(np.asarray(value, dtype=np.float64), shape)
+    template: "ParameterValue | None" = None,
+) -> "ParameterValue":
+    parameter_value, resolved_shape = _parameter_value_types()
+    shape = template.shape if template is not None else resolved_shape()
+    return parameter_value(np.asarray(value, dtype=np.float64), shape)
 
 
 class SimulateCommand(CliCommand):
@@ -48,21 +64,7 @@ class SimulateCommand(CliCommand):
     The `CONFIG` argument should point to a valid configuration file.
     """
 
-    @property
-    def target(self) -> str | None:
-        """
-        Get the resolved simulate target name.
-
-        The returned value accounts for the implicit default target used when
-        no `--target` option was provided.
-        """
-        config_model = ConfigurationModel.from_yaml(self.bound_kwargs["config"])
-        target, _ = _resolve_config_target(
-            config_model.simulate,
-            self.bound_kwargs.get("target"),
-            "simulate",
-        )
-        return target
+    target_section = "simulate"
 
     def run(  # type: ignore[override]
         self,
@@ -82,9 +84,14 @@ class SimulateCommand(CliCommand):
         Returns:
             An exit code indicating success or failure.
         """
+        # Deferred so other commands do not pay for the simulation stack.
+        run_meta_type = import_module("flepimop2.meta").RunMeta
+        build_scenario = import_module("flepimop2.scenario.abc").build
+        simulator_type = import_module("flepimop2.simulator").Simulator
+
         config_model = ConfigurationModel.from_yaml(config)
 
-        simulator = Simulator.from_configuration_model(config_model, target=target)
+        simulator = simulator_type.from_configuration_model(config_model, target=target)
         initial_state, params = simulator.resolve_inputs()
 
         if simulator.simulate_config is None:
@@ -94,11 +101,11 @@ class SimulateCommand(CliCommand):
 
         for component in ["system", "engine", "backend"]:
             name = getattr(simulator.simulate_config, component)
-            config = getattr(simulator, f"{component}_config")
-            self.info(f"  {component.capitalize()}: {name} => {config}")
-        self.info(f"  Y0: {initial_state} [{type(initial_state)}]")
-        self.info(f"  Params: {params} [{type(params)}]")
-        self.info(f"  T: {simulator.simulate_config.times}")
+            component_config = getattr(simulator, f"{component}_config")
+            self.info("  %s: %s => %s", component.capitalize(), name, component_config)
+        self.info("  Y0: %s [%s]", initial_state, type(initial_state))
+        self.info("  Params: %s [%s]", params, type(params))
+        self.info("  T: %s", simulator.simulate_config.times)
 
         if dry_run:
             return ExitCode.OKAY
@@ -107,7 +114,7 @@ class SimulateCommand(CliCommand):
             # extract scenario parameters from the configuration
             scenario_config = build_scenario(config_model.scenarios[scenario_name])
             for counter, scenario_tuple in enumerate(scenario_config.scenarios()):
-                self.info(f"Running scenario: {scenario_tuple}")
+                self.info("Running scenario: %s", scenario_tuple)
                 scenario_initial_state = initial_state.copy()
                 scenario_params = params.copy()
                 for key, value in scenario_tuple._asdict().items():
@@ -124,7 +131,7 @@ class SimulateCommand(CliCommand):
                 simulator.run(
                     scenario_initial_state,
                     scenario_params,
-                    meta=RunMeta(name=f"scenario_{counter}"),
+                    meta=run_meta_type(name=f"scenario_{counter}"),
                 )
         else:
             simulator.run(initial_state, params)
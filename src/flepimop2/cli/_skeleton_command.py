@@ -17,7 +17,9 @@
 
 __all__ = []
 
+import logging
 import os
+import shutil
 from pathlib import Path
 
 from flepimop2.cli._cli_command import CliCommand
@@ -67,17 +69,18 @@ class SkeletonCommand(CliCommand):
             while not parent_dir.exists():
                 parent_dir = parent_dir.parent
             if os.access(parent_dir, os.W_OK) is False:
-                self.error(f"Cannot write to path: {path}")
+                self.error("Cannot write to path: %s", path)
                 return ExitCode.GENERAL
 
         if dry_run:
-            self.info(f"Would create skeleton project at: {path}")
+            self.info("Would create skeleton project at: %s", path)
             return ExitCode.OKAY
         path.mkdir(parents=True, exist_ok=True)
         template_dir = Path(__file__).parent.parent / "templates" / "skeleton"
         self._copy_template_tree(template_dir, path)
-        self.info(f"Skeleton project created at: {path}")
-        self.info(f"Directory structure:\n{self._generate_tree(path)}")
+        self.info("Skeleton project created at: %s", path)
+        if self.is_enabled_for(logging.INFO):
+            self.info("Directory structure:\n%s", self._generate_tree(path))
         return ExitCode.OKAY
 
     @staticmethod
@@ -85,6 +88,13 @@ class SkeletonCommand(CliCommand):
         """
         Recursively copy template directory structure to destination.
 
+        Files are copied as raw bytes with `shutil.copyfile`, which uses the
+        platform's fast-copy syscalls (e.g. `sendfile` on Linux) rather than
+        decoding and re-encoding each template. Existing files in `destination`
+        are overwritten. Only file contents are copied: directories are created
+        with the default mode and existing directories keep their permissions
+        and timestamps.
+
         Args:
             source: The source template directory to copy from.
             destination: The destination directory to copy to.
@@ -116,7 +126,7 @@ class SkeletonCommand(CliCommand):
                 dest_item.mkdir(parents=True, exist_ok=True)
                 SkeletonCommand._copy_template_tree(item, dest_item)
             else:
-                dest_item.write_text(item.read_text())
+                shutil.copyfile(item, dest_item)
 
     @staticmethod
     def _generate_tree(directory: Path, prefix: str = "") -> str:
@@ -147,16 +157,35 @@ class SkeletonCommand(CliCommand):
             <BLANKLINE>
 
         """
-        tree = ""
+        parts: list[str] = []
+        SkeletonCommand._append_tree(os.fspath(directory), prefix, parts)
+        return "".join(parts)
+
+    @staticmethod
+    def _append_tree(directory: str, prefix: str, parts: list[str]) -> None:
+        """
+        Append the ASCII tree lines for `directory` to `parts`.
+
+        Uses `os.scandir` so each entry's directory-ness comes from the cached
+        `DirEntry` type rather than a separate `stat` call per entry.
+
+        Args:
+            directory: The directory to list.
+            prefix: The prefix for the current level.
+            parts: The accumulated output lines, extended in place.
+        """
         try:
-            items = sorted(directory.iterdir(), key=lambda x: (not x.is_dir(), x.name))
-        except (OSError, PermissionError):
-            return tree
-        for i, item in enumerate(items):
-            is_last_item = i == len(items) - 1
-            current_prefix = "└── " if is_last_item else "├── "
-            tree += f"{prefix}{current_prefix}{item.name}\n"
-            if item.is_dir():
+            with os.scandir(directory) as it:
+                items = sorted(
+                    ((entry, entry.is_dir()) for entry in it),
+                    key=lambda item: (not item[1], item[0].name),
+                )
+        except OSError:
+            return
+        last_index = len(items) - 1
+        for i, (entry, is_dir) in enumerate(items):
+            is_last_item = i == last_index
+            parts.append(f"{prefix}{'└── ' if is_last_item else '├── '}{entry.name}\n")
+            if is_dir:
                 next_prefix = prefix + ("    " if is_last_item else "│   ")
-                tree += SkeletonCommand._generate_tree(item, next_prefix)
-        return tree
+                SkeletonCommand._append_tree(entry.path, next_prefix, parts)
@@ -163,7 +163,9 @@ class ConfigurationModel(
         Returns:
             The sorted list of conflicting keys.
         """
-        return sorted(set(current) & set(patch))
+        if not current or not patch:
+            return []
+        return sorted(current.keys() & patch.keys())
 
     @staticmethod
     def _patch_section(
@@ -353,140 +355,106 @@ class ConfigurationModel(
         )
         return patched
 
-    def _check_simulate_engines_or_systems(
-        self, kind: Literal["engine", "system", "backend"]
-    ) -> None:
+    @staticmethod
+    def _missing_simulate_references(
+        kind: Literal["engine", "system", "backend"],
+        items: set[IdentifierString],
+        defined: Mapping[IdentifierString, object],
+    ) -> str | None:
         """
-        Ensure that all engines/systems/backends referenced in simulate exist.
+        Describe the engines/systems/backends referenced in simulate but not defined.
 
         Args:
             kind: Either "engine", "system", or "backend" to specify which to check.
+            items: The names of that kind referenced across the simulate section.
+            defined: The configuration section holding the definitions of that kind.
 
-        Raises:
-            ValueError: If any referenced engines or systems are not defined.
+        Returns:
+            An error message listing the missing references, or `None` if every
+            reference is defined.
         """
-        items = {getattr(sim, kind) for sim in self.simulate.values()}
-        defined = set(getattr(self, f"{kind}s").keys())
-        if missing := items - defined:
-            msg = (
+        if missing := items.difference(defined):
+            return (
                 f"{kind}s referenced in simulate not defined: "
-                f"{missing}. Available {kind}s: {defined}"
+                f"{missing}. Available {kind}s: {set(defined)}"
             )
-            raise ValueError(msg)
+        return None
 
     @model_validator(mode="after")
-    def _check_simulate_engines(self) -> Self:
+    def _check_simulate_references(self) -> Self:
         """
-        Ensure that all engines referenced in simulate exist.
+        Ensure that all engines, systems, and backends referenced in simulate exist.
+
+        The simulate section is walked once to collect every reference, then each
+        kind is checked in turn: engines, then systems, then backends. Missing
+        references of every kind are reported together in a single error.
 
         Returns:
             The validated `ConfigurationModel` instance.
 
+        Raises:
+            ValueError: If any referenced engines, systems, or backends are not
+                defined.
+
         Examples:
             >>> from flepimop2.configuration import ConfigurationModel
-            >>> config = {
-            ...     "engines": {
-            ...         "foo": {"module": "test"},
-            ...     },
-            ...     "systems": {
-            ...         "bar": {"module": "test"},
-            ...     },
-            ...     "backends": {
-            ...         "csv": {"module": "test"},
-            ...     },
-            ...     "simulate": {
-            ...         "sim1": {
-            ...             "engine": "fizz",
-            ...             "system": "bar",
-            ...             "backend": "csv",
-            ...             "times": [1.0, 2.0, 3.0],
+            >>> def config(engine: str, system: str, backend: str) -> dict:
+            ...     return {
+            ...         "engines": {"foo": {"module": "test"}},
+            ...         "systems": {"bar": {"module": "test"}},
+            ...         "backends": {"csv": {"module": "test"}},
+            ...         "simulate": {
+            ...             "sim1": {
+            ...                 "engine": engine,
+            ...                 "system": system,
+            ...                 "backend": backend,
+            ...                 "times": [1.0, 2.0, 3.0],
+            ...             },
             ...         },
-            ...     },
-            ... }
-            >>> ConfigurationModel.model_validate(config)
+            ...     }
+            >>> ConfigurationModel.model_validate(config("fizz", "bar", "csv"))
             Traceback (most recent call last):
                 ...
             pydantic_core._pydantic_core.ValidationError: 1 validation error for ConfigurationModel
               Value error, engines referenced in simulate not defined: {'fizz'}. Available engines: {'foo'} [...]
                 For further information visit ...
-        """  # noqa: E501
-        self._check_simulate_engines_or_systems("engine")
-        return self
-
-    @model_validator(mode="after")
-    def _check_simulate_systems(self) -> Self:
-        """
-        Ensure that all systems referenced in simulate exist.
-
-        Returns:
-            The validated `ConfigurationModel` instance.
-
-        Examples:
-            >>> from flepimop2.configuration import ConfigurationModel
-            >>> config = {
-            ...     "engines": {
-            ...         "foo": {"module": "test"},
-            ...     },
-            ...     "systems": {
-            ...         "bar": {"module": "test"},
-            ...     },
-            ...     "backends": {
-            ...         "csv": {"module": "test"},
-            ...     },
-            ...     "simulate": {
-            ...         "sim1": {
-            ...             "engine": "foo",
-            ...             "system": "buzz",
-            ...             "backend": "csv",
-            ...             "times": [1.0, 2.0, 3.0],
-            ...         },
-            ...     },
-            ... }
-            >>> ConfigurationModel.model_validate(config)
+            >>> ConfigurationModel.model_validate(config("foo", "buzz", "csv"))
             Traceback (most recent call last):
                 ...
             pydantic_core._pydantic_core.ValidationError: 1 validation error for ConfigurationModel
               Value error, systems referenced in simulate not defined: {'buzz'}. Available systems: {'bar'} [...]
                 For further information visit ...
-        """  # noqa: E501
-        self._check_simulate_engines_or_systems("system")
-        return self
-
-    @model_validator(mode="after")
-    def _check_simulate_backends(self) -> Self:
-        """
-        Ensure that all backends referenced in simulate exist.
-
-        Returns:
-            The validated `ConfigurationModel` instance.
-
-        Examples:
-            >>> from flepimop2.configuration import ConfigurationModel
-            >>> config = {
-            ...     "engines": {
-            ...         "foo": {"module": "test"},
-            ...     },
-            ...     "systems": {
-            ...         "bar": {"module": "test"},
-            ...     },
-            ...     "backends": {
-            ...         "csv": {"module": "test"},
-            ...     },
-            ...     "simulate": {
-            ...         "sim1": {
-            ...             "engine": "foo",
-            ...             "system": "bar",
-            ...             "backend": "db",
-            ...             "times": [1.0, 2.0, 3.0],
-            ...         },
-            ...     },
-            ... }
-            >>> configuration = ConfigurationModel.model_validate(config)
+            >>> ConfigurationModel.model_validate(config("foo", "bar", "db"))
             Traceback (most recent call last):
                 ...
             pydantic_core._pydantic_core.ValidationError: 1 validation error for ConfigurationModel
               Value error, backends referenced in simulate not defined: {'db'}. Available backends: {'csv'} [...]
                 For further information visit ...
+            >>> ConfigurationModel.model_validate(config("fizz", "bar", "db"))
+            Traceback (most recent call last):
+                ...
+            pydantic_core._pydantic_core.ValidationError: 1 validation error for ConfigurationModel
+              Value error, engines referenced in simulate not defined: {'fizz'}. Available engines: {'foo'}; backends referenced in simulate not defined: {'db'}. Available backends: {'csv'} [...]
+                For further information visit ...
         """  # noqa: E501
-        self._check_simulate_engines_or_systems("backend")
+        if not self.simulate:
+            return self
+        engines: set[IdentifierString] = set()
+        systems: set[IdentifierString] = set()
+        backends: set[IdentifierString] = set()
+        for sim in self.simulate.values():
+            engines.add(sim.engine)
+            systems.add(sim.system)
+            backends.add(sim.backend)
+        errors = [
+            msg
+            for msg in (
+                self._missing_simulate_references("engine", engines, self.engines),
+                self._missing_simulate_references("system", systems, self.systems),
+                self._missing_simulate_references("backend", backends, self.backends),
+            )
+            if msg is not None
+        ]
+        if errors:
+            raise ValueError("; ".join(errors))
         return self
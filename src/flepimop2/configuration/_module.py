@@ -13,7 +13,7 @@
 #
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
-from typing import Annotated, Any, TypeAlias
+from typing import Annotated, Any, Final, TypeAlias
 
 from pydantic import BeforeValidator
 
@@ -30,6 +30,8 @@ ModuleGroupModel = Annotated[
 ]
 """Module group configuration model for flepimop2."""
 
+_NUMERIC_PARAMETER_TYPES: Final = frozenset({int, float})
+
 
 def _coerce_parameter_configuration_value(value: Any) -> Any:  # noqa: ANN401
     """
@@ -55,7 +57,7 @@ def _coerce_parameter_configuration_value(value: Any) -> Any:  # noqa: ANN401
         >>> _coerce_parameter_configuration_value(None) is None
         True
     """
-    if isinstance(value, (int, float)) and not isinstance(value, bool):
+    if type(value) in _NUMERIC_PARAMETER_TYPES:
         return f"fixed({value!r})"
     return value
 
@@ -59,9 +59,13 @@ class GridScenario(ScenarioABC, module="grid"):
         """
         Expose the scenarios.
 
+        The scenario tuple type is created once per call rather than once per
+        combination, since `scenario_type` builds a new `NamedTuple` class on
+        every access.
+
         Yields:
             Scenario tuples from parameters.
         """
-        param_lists = self.parameters.values()
-        for p in itertools.product(*param_lists):
-            yield self.scenario_type(*p)
+        scenario_type = self.scenario_type
+        for p in itertools.product(*self.parameters.values()):
+            yield scenario_type(*p)
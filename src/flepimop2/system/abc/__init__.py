@@ -27,7 +27,7 @@ import inspect
 import sys
 from abc import abstractmethod
 from collections.abc import Callable
-from typing import Any
+from typing import Any, Final
 
 import numpy as np
 from pydantic import PrivateAttr
@@ -54,6 +54,8 @@ if sys.version_info >= (3, 12):
 else:
     from typing_extensions import override
 
+_BIND_FORBIDDEN_KEYS: Final = frozenset({"time", "state"})
+
 
 class SystemABC(ModuleBase, module_namespace="system"):
     """
@@ -95,7 +97,7 @@ class SystemABC(ModuleBase, module_namespace="system"):
                 or if the parameter values are incompatible with System definition.
         """  # noqa: DOC502
         checked_pars = _consolidate_args(
-            forbidden={"time", "state"}, params=params, **kwargs
+            forbidden=_BIND_FORBIDDEN_KEYS, params=params, **kwargs
         )
         return self._bind_impl(params=checked_pars)
 
@@ -16,16 +16,23 @@
 """Public testing utilities for `flepimop2`."""
 
 __all__ = ["external_provider_package", "flepimop2_run", "project_skeleton"]
+import os
 import re
 import subprocess  # noqa: S404
+from functools import cache
 from pathlib import Path
 from shutil import which
 
 
+@cache
 def _which_python() -> str:
     """
     Find the 'python' executable in the system PATH.
 
+    The lookup is cached for the life of the process since `PATH` is not
+    expected to change between calls, e.g. across a pytest session. A failed
+    lookup is not cached.
+
     Returns:
         The absolute path to the 'python' executable as a string.
 
@@ -84,6 +91,45 @@ def _find_project_root(start: Path) -> Path:
     raise FileNotFoundError(msg)
 
 
+def _venv_executable(parent_directory: Path, name: str) -> Path:
+    """
+    Return the path of an executable inside the `.venv` of `parent_directory`.
+
+    Virtual environments place executables in `Scripts/` with an `.exe` suffix
+    on Windows and in `bin/` elsewhere.
+
+    Args:
+        parent_directory: Directory containing the `.venv` directory.
+        name: The bare executable name, e.g. `python`.
+
+    Returns:
+        The platform-specific path to the executable (not necessarily existing).
+    """
+    if os.name == "nt":
+        return parent_directory / ".venv" / "Scripts" / f"{name}.exe"
+    return parent_directory / ".venv" / "bin" / name
+
+
+def _run(command: list[str], cwd: Path | None) -> subprocess.CompletedProcess[str]:
+    """
+    Run a command, capturing text output and raising on a non-zero exit.
+
+    Args:
+        command: The command and its arguments.
+        cwd: The working directory for the command.
+
+    Returns:
+        The completed process.
+    """
+    return subprocess.run(  # noqa: S603
+        command,
+        capture_output=True,
+        text=True,
+        cwd=cwd,
+        check=True,
+    )
+
+
 def _venv_python_path(parent_directory: Path) -> Path:
     """
     Find the python executable within the `.venv` directory of `parent_directory`.
@@ -98,19 +144,26 @@ def _venv_python_path(parent_directory: Path) -> Path:
         FileNotFoundError: If the python executable is not found in `.venv`.
 
     """
-    if (py := (parent_directory / ".venv" / "bin" / "python")).exists():
+    if (py := _venv_executable(parent_directory, "python")).exists():
         return py
     msg = "Could not find python executable in .venv"
     raise FileNotFoundError(msg)
 
 
-def _create_venv(python: str, parent_directory: Path) -> str:
+def _create_venv(
+    python: str,
+    parent_directory: Path,
+    requirements: list[str] | None = None,
+) -> str:
     """
     Create a virtual environment and install `flepimop2` into it.
 
     Args:
         python: Path to the python executable.
         parent_directory: Directory in which to create the venv at `.venv`.
+        requirements: Optional additional requirements to install alongside
+            `flepimop2`. These are installed in the same `pip install`
+            invocation so dependencies are resolved in a single pass.
 
     Returns:
         The python executable path from the newly created venv.
@@ -120,27 +173,19 @@ def _create_venv(python: str, parent_directory: Path) -> str:
     project_root = _find_project_root(parent_directory)
     venv_dir = parent_directory / ".venv"
 
-    subprocess.run(  # noqa: S603
-        [python, "-m", "venv", str(venv_dir)],
-        capture_output=True,
-        text=True,
-        cwd=parent_directory,
-        check=True,
-    )
+    _run([python, "-m", "venv", str(venv_dir)], parent_directory)
 
     venv_python = _venv_python_path(parent_directory)
-    subprocess.run(  # noqa: S603
+    _run(
         [
             str(venv_python),
             "-m",
             "pip",
             "install",
             str(project_root),
+            *(requirements or []),
         ],
-        capture_output=True,
-        text=True,
-        cwd=parent_directory,
-        check=True,
+        parent_directory,
     )
     return str(venv_python)
 
@@ -218,8 +263,6 @@ def external_provider_package(
 
     """
     parent_directory = parent_directory.resolve()
-    python = _which_python()
-    venv_python = _create_venv(python, parent_directory)
 
     external_provider_root = parent_directory / "external_provider"
     external_provider_root.mkdir(parents=True, exist_ok=True)
@@ -255,20 +298,9 @@ packages = ["src/flepimop2"]
         dest_path.parent.mkdir(parents=True, exist_ok=True)
         dest_path.write_text(src.read_text())
 
-    subprocess.run(  # noqa: S603
-        [
-            venv_python,
-            "-m",
-            "pip",
-            "install",
-            str(external_provider_root),
-        ],
-        capture_output=True,
-        text=True,
-        cwd=parent_directory,
-        check=True,
+    return _create_venv(
+        _which_python(), parent_directory, [str(external_provider_root)]
     )
-    return venv_python
 
 
 def project_skeleton(
@@ -290,17 +322,11 @@ def project_skeleton(
 
     """
     parent_directory = parent_directory.resolve()
-    python = _which_python()
-    venv_python = _create_venv(python, parent_directory)
-
-    if dependencies := _resolve_dependencies(dependencies, require_flepimop2=False):
-        subprocess.run(  # noqa: S603
-            [venv_python, "-m", "pip", "install", *dependencies],
-            capture_output=True,
-            text=True,
-            cwd=parent_directory,
-            check=True,
-        )
+    venv_python = _create_venv(
+        _which_python(),
+        parent_directory,
+        _resolve_dependencies(dependencies, require_flepimop2=False),
+    )
 
     flepimop2_run("skeleton", args=[], cwd=parent_directory)
 
@@ -339,15 +365,9 @@ def flepimop2_run(
         raise ValueError(msg)
 
     args = args or []
-    if cwd is not None and ((venv_bin := cwd / ".venv" / "bin" / "flepimop2").exists()):
+    if cwd is not None and (venv_bin := _venv_executable(cwd, "flepimop2")).exists():
         command = [str(venv_bin), action, *args]
     else:
         command = ["flepimop2", action, *args]
 
-    return subprocess.run(  # noqa: S603
-        command,
-        capture_output=True,
-        text=True,
-        cwd=cwd,
-        check=True,
-    )
+    return _run(command, cwd)
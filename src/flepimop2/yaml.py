@@ -24,16 +24,26 @@ __all__ = [
     "yaml_sequence",
 ]
 
+import os
 from collections import UserDict, UserList
 from collections.abc import Iterable, Mapping
+from io import BufferedReader, TextIOWrapper
 from pathlib import Path
-from typing import Any, Self, TypeVar
+from typing import Any, Final, Self, TypeVar
 
 from pydantic import BaseModel, PrivateAttr
 from typing_extensions import override
 from yaml import MappingNode, SafeDumper, SequenceNode
 from yaml import dump as yaml_dump
-from yaml import safe_load as yaml_safe_load
+from yaml import load as yaml_load
+
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - depends on the PyYAML build
+    from yaml import SafeLoader as _SafeLoader
+
+_STREAM_THRESHOLD_BYTES: Final[int] = 64 * 1024
+_STREAM_BUFFER_BYTES: Final[int] = 128 * 1024
 
 T = TypeVar("T")
 K = TypeVar("K")
@@ -208,12 +218,14 @@ Flepimop2YamlDumper.add_representer(
 )
 
 
-def _has_explicit_document_start(contents: str) -> bool:
+def _has_explicit_document_start(contents: str | Iterable[str]) -> bool:
     r"""
     Return whether YAML text has an explicit document-start marker.
 
     Args:
-        contents: The YAML text to check.
+        contents: The YAML text to check, or an iterable of its lines such as
+            an open text file. Only the lines up to the first content line
+            are consumed.
 
     Returns:
         Whether `contents` has an explicit YAML document-start marker before
@@ -238,9 +250,14 @@ def _has_explicit_document_start(contents: str) -> bool:
         True
         >>> _has_explicit_document_start("%YAML 1.2\n---\nname: demo")
         True
+        >>> _has_explicit_document_start(["# foobar\n", "---\n", "name: demo\n"])
+        True
     """
-    contents = contents.removeprefix("\ufeff")
-    for line in contents.splitlines():
+    lines = contents.splitlines() if isinstance(contents, str) else contents
+    for index, raw_line in enumerate(lines):
+        line = raw_line.rstrip("\r\n")
+        if index == 0:
+            line = line.removeprefix("\ufeff")
         stripped_line = line.strip()
         if not stripped_line or stripped_line.startswith("#"):
             continue
@@ -368,24 +385,47 @@ class YamlSerializableBaseModel(BaseModel):
             >>> DemoModel.safe_load("name: demo")
             DemoModel(name='demo')
         """
-        model = cls.model_validate(yaml_safe_load(contents))
+        model = cls.model_validate(yaml_load(contents, Loader=_SafeLoader))
         model.set_document_start_marker(value=_has_explicit_document_start(contents))
         return model
 
     @classmethod
-    def from_yaml(cls, file: Path, encoding: str = "utf-8", **kwargs: Any) -> Self:
+    def from_yaml(
+        cls, file: Path, encoding: str = "utf-8", errors: str = "strict"
+    ) -> Self:
         """
         Deserialize a YAML file to an instance of the model.
 
         Args:
             file: Path to the YAML file to read.
             encoding: Encoding of the YAML file.
-            **kwargs: Additional keyword arguments to pass to `Path.read_text`.
+            errors: How decoding errors are handled, as for `bytes.decode`.
 
         Returns:
             An instance of the model.
+
+        Notes:
+            The file is opened once and its size taken from that open file.
+            Files smaller than 64 KiB are read in binary mode and decoded once,
+            which avoids the buffered text-mode I/O stack used by
+            `Path.read_text`. Larger files are streamed through the YAML loader
+            with a 128 KiB read buffer so the raw text and the parsed tree are
+            never held in memory at the same time.
         """
-        return cls.safe_load(file.read_text(encoding=encoding, **kwargs))
+        with file.open("rb", buffering=0) as raw:
+            if os.fstat(raw.fileno()).st_size < _STREAM_THRESHOLD_BYTES:
+                return cls.safe_load(raw.read().decode(encoding, errors))
+            with TextIOWrapper(
+                BufferedReader(raw, _STREAM_BUFFER_BYTES),
+                encoding=encoding,
+                errors=errors,
+            ) as stream:
+                data = yaml_load(stream, Loader=_SafeLoader)
+                stream.seek(0)
+                explicit_start = _has_explicit_document_start(stream)
+        model = cls.model_validate(data)
+        model.set_document_start_marker(value=explicit_start)
+        return model
 
     def safe_dump(self, *, explicit_start: bool | None = None) -> str:
         """
@@ -53,3 +53,20 @@ def test_build_requires_explicit_module(
         ),
     ):
         builder({})
+
+
+def test_build_does_not_share_mutable_values_with_module_config() -> None:
+    """Modules built from a `ModuleBase` should own copies of nested values."""
+    config = ModuleBase.model_validate({
+        "module": "fixed",
+        "value": [1.0, 2.0],
+        "options": {"a": [1]},
+    })
+
+    parameter = build_parameter(config)
+    assert parameter.options is not None
+    parameter.options["a"].append(2)
+
+    assert config.model_extra is not None
+    assert parameter.value is not config.model_extra["value"]  # type: ignore[attr-defined]
+    assert config.options == {"a": [1]}
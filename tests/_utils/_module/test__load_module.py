@@ -37,6 +37,14 @@ def test_load_module_file_not_found(tmp_path: Path) -> None:
         _load_module(non_existent_file, "test_module")
 
 
+def test_load_module_path_under_a_file(tmp_path: Path) -> None:
+    """Test that a path through a regular file reports the missing file."""
+    parent = tmp_path / "not_a_directory"
+    parent.write_text("", encoding="utf-8")
+    with pytest.raises(FileNotFoundError, match=r"No file found at: .*script\.py"):
+        _load_module(parent / "script.py", "test_module")
+
+
 def test_load_module_not_python_file(tmp_path: Path) -> None:
     """Test that FileNotFoundError is raised when file is not a Python file."""
     txt_file = tmp_path / "not_python.txt"
@@ -86,3 +94,26 @@ def test_load_module_success(tmp_path: Path, fixture: str) -> None:
     # Verify module was loaded
     assert mod is not None
     assert mod.__name__ == module_name
+
+
+def test_load_module_reuses_unchanged_file(tmp_path: Path) -> None:
+    """Loading an unchanged file twice returns the same module object."""
+    test_file = tmp_path / "simple_module.py"
+    copy(FIXTURE_DIR / "simple_module.py", test_file)
+
+    first = _load_module(test_file, "simple_module")
+    assert _load_module(test_file, "simple_module") is first
+    assert _load_module(test_file, "other_name") is not first
+
+
+def test_load_module_reloads_modified_file(tmp_path: Path) -> None:
+    """Modifying the file on disk causes it to be executed again."""
+    test_file = tmp_path / "changing.py"
+    test_file.write_text("VALUE = 1\n", encoding="utf-8")
+    first = _load_module(test_file, "changing")
+
+    test_file.write_text("VALUE = 2\n", encoding="utf-8")
+    second = _load_module(test_file, "changing")
+
+    assert second is not first
+    assert second.VALUE == 2
@@ -23,6 +23,7 @@ import pytest
 from numpy.testing import assert_array_equal
 
 from flepimop2.backend.abc import build
+from flepimop2.backend.csv import CsvBackend
 from flepimop2.meta import RunMeta
 from flepimop2.typing import Float64NDArray
 
@@ -60,3 +61,31 @@ def test_csv_backend_save_and_read_round_trip(
     loaded_array = backend.read(run_meta)
 
     assert_array_equal(loaded_array, sample_array)
+
+
+def test_csv_backend_relative_root_is_checked_per_working_directory(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A relative root valid in one directory should not pass in another."""
+    (tmp_path / "first" / "out").mkdir(parents=True)
+    (tmp_path / "second").mkdir()
+
+    monkeypatch.chdir(tmp_path / "first")
+    backend = build({"module": "csv", "root": "out"})
+    assert isinstance(backend, CsvBackend)
+    assert backend.root == Path("out")
+
+    monkeypatch.chdir(tmp_path / "second")
+    with pytest.raises(TypeError, match="not a directory or is not writable"):
+        build({"module": "csv", "root": "out"})
+
+
+def test_csv_backend_root_is_checked_on_every_build(tmp_path: Path) -> None:
+    """A root removed after a successful build should fail the next build."""
+    root = tmp_path / "out"
+    root.mkdir()
+    build({"module": "csv", "root": str(root)})
+
+    root.rmdir()
+    with pytest.raises(TypeError, match="not a directory or is not writable"):
+        build({"module": "csv", "root": str(root)})
@@ -0,0 +1,82 @@
+# flepimop2: The FLExible Pipeline for Interchangeable MOdel Processing
+# Copyright (C) 2026  Carl Pearson, Joshua Macdonald, Timothy Willard
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""Unit tests for the `NpyBackend` class."""
+
+from datetime import UTC, datetime
+from pathlib import Path
+
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+from flepimop2.backend.abc import build
+from flepimop2.backend.npy import NpyBackend
+from flepimop2.meta import RunMeta
+from flepimop2.typing import Float64NDArray
+
+
+@pytest.mark.parametrize(
+    ("sample_array", "run_meta"),
+    [
+        (
+            np.array([[1.0, 2.0], [3.0, 4.0]]),
+            RunMeta(
+                action="simulate",
+                timestamp=datetime(2023, 1, 1, 12, 0, 0, tzinfo=UTC),
+                name="array_test",
+            ),
+        ),
+        (
+            np.array([[0.0]]),
+            RunMeta(
+                action="simulate",
+                timestamp=datetime(2024, 6, 15, 8, 45, 0, tzinfo=UTC),
+                name=None,
+            ),
+        ),
+    ],
+)
+def test_npy_backend_save_and_read_round_trip(
+    tmp_path: Path,
+    sample_array: Float64NDArray,
+    run_meta: RunMeta,
+) -> None:
+    """Test that saving and reading an array returns the same data."""
+    backend = build({"module": "npy", "root": str(tmp_path)})
+    assert isinstance(backend, NpyBackend)
+
+    backend.save(sample_array, run_meta)
+    loaded_array = backend.read(run_meta)
+
+    assert_array_equal(loaded_array, sample_array)
+    assert loaded_array.dtype == np.float64
+
+
+def test_npy_backend_read_is_read_only_memory_map(tmp_path: Path) -> None:
+    """Reads are memory-mapped and cannot be written through."""
+    backend = build({"module": "npy", "root": str(tmp_path)})
+    run_meta = RunMeta(
+        action="simulate",
+        timestamp=datetime(2025, 3, 1, 9, 30, 0, tzinfo=UTC),
+        name="mmap",
+    )
+    backend.save(np.arange(6, dtype=np.float64).reshape(2, 3), run_meta)
+
+    loaded_array = backend.read(run_meta)
+
+    assert isinstance(loaded_array, np.memmap)
+    assert not loaded_array.flags.writeable
+    assert (tmp_path / "mmap_simulate_20250301_093000.npy").is_file()
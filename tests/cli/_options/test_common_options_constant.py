@@ -19,6 +19,7 @@ from collections import Counter
 from collections.abc import Callable
 
 import click
+import pytest
 
 from flepimop2.cli._options import COMMON_OPTIONS
 
@@ -90,3 +91,9 @@ def test_argument_help_is_only_defined_for_arguments() -> None:
             f"{name} defines shared argument help but is not backed by "
             "click.argument; use click.option(..., help=...) directly for options."
         )
+
+
+def test_common_options_is_read_only() -> None:
+    """Test that COMMON_OPTIONS cannot be mutated at runtime."""
+    with pytest.raises(TypeError):
+        COMMON_OPTIONS["new_option"] = COMMON_OPTIONS["check"]  # type: ignore[index]
@@ -15,6 +15,7 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """Unit tests for SkeletonCommand._copy_template_tree method."""
 
+import stat
 from pathlib import Path
 
 from flepimop2.cli._skeleton_command import SkeletonCommand
@@ -56,3 +57,19 @@ def test_copy_mixed_structure(tmp_path: Path) -> None:
     assert (dest / "data" / "input" / "data.csv").read_text() == "col1,col2\n1,2"
     assert (dest / "data" / "output").is_dir()
     assert not (dest / "data" / "output" / ".gitkeep").read_text()
+
+
+def test_copy_preserves_destination_directory_metadata(tmp_path: Path) -> None:
+    """Copying should not change the mode of existing destination directories."""
+    source = tmp_path / "source"
+    source.mkdir()
+    (source / "config.yaml").write_text("key: value")
+    source.chmod(0o755)
+    dest = tmp_path / "dest"
+    dest.mkdir()
+    dest.chmod(0o711)
+
+    SkeletonCommand._copy_template_tree(source, dest)
+
+    assert stat.S_IMODE(dest.stat().st_mode) == 0o711
+    assert (dest / "config.yaml").read_text() == "key: value"
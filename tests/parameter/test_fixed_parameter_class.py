@@ -36,6 +36,24 @@ def test_fixed_parameter_returns_scalar_parameter_value(value: float) -> None:
     assert sample.item() == value
 
 
+def test_fixed_parameter_samples_are_independent_and_writable() -> None:
+    """Each sample should own a writable array built from the current value."""
+    param = FixedParameter(value=[1.0, 2.0], shape=("age",))
+    axes = AxisCollection.from_config({
+        "age": {"kind": "categorical", "labels": ["a", "b"]},
+        "region": {"kind": "categorical", "labels": ["x", "y", "z"]},
+    })
+
+    sample = np.asarray(param.sample(axes=axes).value)
+    sample *= 2
+    assert np.asarray(param.sample(axes=axes).value).tolist() == [1.0, 2.0]
+
+    assert isinstance(param.value, list)
+    param.value.append(3.0)
+    param.shape = ("region",)
+    assert np.asarray(param.sample(axes=axes).value).tolist() == [1.0, 2.0, 3.0]
+
+
 @pytest.mark.parametrize(
     ("axes_config", "value"),
     [
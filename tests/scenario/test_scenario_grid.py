@@ -33,3 +33,15 @@ def test_set_valid_static_parameters(params: dict[IdentifierString, Any]) -> Non
     scenario = scenario_build({"module": "grid", "parameters": params})
     expected_scenarios = list(itertools.product(*params.values()))
     assert list(scenario.scenarios()) == expected_scenarios
+
+
+def test_scenarios_share_one_tuple_type() -> None:
+    """All scenarios from one iteration should share a single tuple type."""
+    scenario = scenario_build({
+        "module": "grid",
+        "parameters": {"param1": [1, 2, 3], "param2": [0.1, 0.2]},
+    })
+    scenarios = list(scenario.scenarios())
+    assert len(scenarios) == 6
+    assert len({type(s) for s in scenarios}) == 1
+    assert scenarios[0]._fields == ("param1", "param2")
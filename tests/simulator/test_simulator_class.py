@@ -16,11 +16,13 @@
 """Tests for simulator input resolution from system contracts."""
 
 from pathlib import Path
+from unittest.mock import patch
 
 import numpy as np
 import pytest
 
 from flepimop2.configuration import ConfigurationModel
+from flepimop2.parameter.abc import build as build_parameter
 from flepimop2.simulator import Simulator
 
 ENGINE_SCRIPT = (
@@ -37,13 +39,14 @@ SYSTEM_SCRIPT = (
 )
 
 
-def test_simulator_resolves_inputs_and_runs(
-    tmp_path: Path,
-) -> None:
-    """Simulator should resolve structured inputs and execute the engine."""
-    output_root = tmp_path / "model_output"
-    output_root.mkdir()
-    config = ConfigurationModel.model_validate({
+def _demo_config(output_root: Path) -> ConfigurationModel:
+    """
+    Build the demo SIR configuration used by the simulator tests.
+
+    Returns:
+        The validated configuration model.
+    """
+    return ConfigurationModel.model_validate({
         "axes": {
             "age": {
                 "kind": "categorical",
@@ -95,6 +98,15 @@ def test_simulator_resolves_inputs_and_runs(
         },
     })
 
+
+def test_simulator_resolves_inputs_and_runs(
+    tmp_path: Path,
+) -> None:
+    """Simulator should resolve structured inputs and execute the engine."""
+    output_root = tmp_path / "model_output"
+    output_root.mkdir()
+    config = _demo_config(output_root)
+
     simulator = Simulator.from_configuration_model(config)
     initial_state, params = simulator.resolve_inputs()
 
@@ -118,3 +130,22 @@ def test_simulator_resolves_inputs_and_runs(
         result[1, 1:],
         np.array([100.4, 100.4, 100.4, 1.4, 1.4, 1.4, 0.4, 0.4, 0.4]),
     )
+
+
+def test_simulator_builds_fresh_parameters_per_resolution(tmp_path: Path) -> None:
+    """Each input resolution should build new parameter module instances."""
+    output_root = tmp_path / "model_output"
+    output_root.mkdir()
+    simulator = Simulator.from_configuration_model(_demo_config(output_root))
+
+    with patch(
+        "flepimop2.simulator.build_parameter", wraps=build_parameter
+    ) as mock_build:
+        first = simulator.resolve_inputs()
+        second = simulator.resolve_inputs()
+
+    assert mock_build.call_count == 10
+    built = [call.args[0] for call in mock_build.call_args_list]
+    assert built[:5] == built[5:]
+    assert tuple(first[0]) == tuple(second[0])
+    assert tuple(first[1]) == tuple(second[1])
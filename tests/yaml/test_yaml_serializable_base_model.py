@@ -91,6 +91,54 @@ def test_yaml_serialization_round_trip(
     assert loaded == instance
 
 
+@pytest.mark.parametrize("explicit_start", [False, True])
+def test_from_yaml_streams_large_files(tmp_path: Path, *, explicit_start: bool) -> None:
+    """Large files should load identically through the streaming path."""
+    instance = ComplexModel(
+        name="large",
+        items=[SimpleModel(name=f"item{i}", count=i) for i in range(4000)],
+        metadata={"key": "value"},
+    )
+    yaml_file = tmp_path / "large.yaml"
+    instance.to_yaml(yaml_file, explicit_start=explicit_start)
+    assert yaml_file.stat().st_size > 64 * 1024
+
+    loaded = ComplexModel.from_yaml(yaml_file)
+
+    assert loaded.model_dump() == instance.model_dump()
+    assert loaded.document_start_marker is explicit_start
+
+
+def test_from_yaml_decodes_bytes_with_encoding_and_kwargs(tmp_path: Path) -> None:
+    """`from_yaml` should decode the raw file bytes with the given encoding."""
+    yaml_file = tmp_path / "test.yaml"
+    yaml_file.write_bytes("name: caf\xe9\r\ncount: 1\r\n".encode("latin-1"))
+
+    assert SimpleModel.from_yaml(yaml_file, encoding="latin-1") == SimpleModel(
+        name="caf\xe9", count=1
+    )
+    assert SimpleModel.from_yaml(yaml_file, errors="replace") == SimpleModel(
+        name="caf\ufffd", count=1
+    )
+
+
+@pytest.mark.parametrize("padding", [0, 64 * 1024])
+def test_from_yaml_errors_apply_regardless_of_file_size(
+    tmp_path: Path, padding: int
+) -> None:
+    """`errors` should behave the same on the small-file and streaming paths."""
+    yaml_file = tmp_path / "test.yaml"
+    yaml_file.write_bytes(
+        b"# " + b"x" * padding + b"\nname: caf\xe9\ncount: 1\n",
+    )
+
+    assert SimpleModel.from_yaml(yaml_file, errors="replace") == SimpleModel(
+        name="caf\ufffd", count=1
+    )
+    with pytest.raises(UnicodeDecodeError):
+        SimpleModel.from_yaml(yaml_file)
+
+
 @pytest.mark.parametrize(
     ("model_class", "instance"),
     [